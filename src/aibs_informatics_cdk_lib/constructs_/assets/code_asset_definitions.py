@@ -1,5 +1,7 @@
 import logging
 import os
+import re
+from functools import lru_cache
 from pathlib import Path
 
 import aws_cdk as cdk
@@ -7,6 +9,7 @@ import constructs
 from aibs_informatics_core.env import EnvBase
 from aibs_informatics_core.utils.decorators import cached_property
 from aibs_informatics_core.utils.hashing import generate_path_hash
+from aibs_informatics_core.utils.os_operations import find_all_paths
 from aws_cdk import aws_ecr_assets, aws_s3_assets
 from aws_cdk import aws_lambda as lambda_
 
@@ -24,6 +27,37 @@ AIBS_INFORMATICS_AWS_LAMBDA_REPO = "git@github.com:AllenInstitute/aibs-informati
 logger = logging.getLogger(__name__)
 
 
+_REPO_HASH_EXCLUDE_PATTERNS = [re.compile(exclude) for exclude in PYTHON_REGEX_EXCLUDES]
+
+
+def _get_repo_file_stats(repo_path: str) -> tuple[tuple[str, int, int], ...]:
+    """Get the (path, mtime, size) of every file hashed by `_generate_repo_hash`"""
+    file_stats = []
+    for path in find_all_paths(repo_path, include_dirs=False):
+        if any(pattern.fullmatch(path) for pattern in _REPO_HASH_EXCLUDE_PATTERNS):
+            continue
+        stat = os.stat(path)
+        file_stats.append((path, stat.st_mtime_ns, stat.st_size))
+    return tuple(file_stats)
+
+
+@lru_cache(maxsize=16)
+def _generate_repo_hash_for_stats(
+    repo_path: str, file_stats: tuple[tuple[str, int, int], ...]
+) -> str:
+    return generate_path_hash(path=repo_path, excludes=PYTHON_REGEX_EXCLUDES)
+
+
+def _generate_repo_hash(repo_path: str) -> str:
+    """Hash the python sources of a repo, reusing the hash until its files change.
+
+    The code and docker assets of a repo are hashed over the same files, so the (costly) read
+    of the repo is shared between them. Files are only stat'ed to check whether any were added,
+    removed or modified since the cached hash was computed.
+    """
+    return _generate_repo_hash_for_stats(repo_path, _get_repo_file_stats(repo_path))
+
+
 class AssetsMixin:
     @classmethod
     def resolve_repo_path(cls, repo_url: str, repo_path_env_var: str | None) -> Path:
@@ -86,10 +120,7 @@ class AIBSInformaticsCodeAssets(constructs.Construct, AssetsMixin):
             self.AIBS_INFORMATICS_AWS_LAMBDA_REPO, AIBS_INFORMATICS_AWS_LAMBDA_REPO_ENV_VAR
         )
 
-        asset_hash = generate_path_hash(
-            path=str(repo_path.resolve()),
-            excludes=PYTHON_REGEX_EXCLUDES,
-        )
+        asset_hash = _generate_repo_hash(str(repo_path.resolve()))
         logger.info(f"aibs-informatics-aws-lambda asset hash={asset_hash}")
         bundling_image = self.runtime.bundling_image
         host_ssh_dir = str(Path.home() / ".ssh")
@@ -183,10 +214,7 @@ class AIBSInformaticsDockerAssets(constructs.Construct, AssetsMixin):
             platform=aws_ecr_assets.Platform.LINUX_AMD64,
             asset_name="aibs-informatics-aws-lambda",
             file="docker/Dockerfile",
-            extra_hash=generate_path_hash(
-                path=str(repo_path.resolve()),
-                excludes=PYTHON_REGEX_EXCLUDES,
-            ),
+            extra_hash=_generate_repo_hash(str(repo_path.resolve())),
             exclude=[
                 *PYTHON_GLOB_EXCLUDES,
                 *GLOBAL_GLOB_EXCLUDES,
@@ -4,7 +4,7 @@ import base64
 import json
 from abc import abstractmethod
 from dataclasses import dataclass, field
-from typing import Any, Dict, Generic, List, Optional, TypeVar
+from typing import Any, Generic, TypeVar
 
 import constructs
 from aibs_informatics_core.env import EnvBase
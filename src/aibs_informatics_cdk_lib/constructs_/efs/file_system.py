@@ -206,6 +206,7 @@ class EFSEcosystem(EnvBaseConstruct):
         file_system_name: str,
         vpc: ec2.Vpc,
         efs_lifecycle_policy: efs.LifecyclePolicy | None = None,
+        throughput_mode: efs.ThroughputMode = efs.ThroughputMode.BURSTING,
     ) -> None:
         """Initialize an EFS ecosystem.
 
@@ -216,6 +217,9 @@ class EFSEcosystem(EnvBaseConstruct):
             file_system_name (str): Name for the file system.
             vpc (ec2.Vpc): VPC for the file system.
             efs_lifecycle_policy (Optional[efs.LifecyclePolicy]): Lifecycle policy.
+            throughput_mode (efs.ThroughputMode): Throughput mode of the file system.
+                ELASTIC avoids burst credit exhaustion for spiky workloads (e.g. batch data
+                syncs). Defaults to BURSTING.
 
         Note:
             If the EFS filesystem is intended to be deployed in BURSTING throughput mode,
@@ -232,7 +236,7 @@ class EFSEcosystem(EnvBaseConstruct):
             lifecycle_policy=efs_lifecycle_policy,
             out_of_infrequent_access_policy=efs.OutOfInfrequentAccessPolicy.AFTER_1_ACCESS,
             enable_automatic_backups=False,
-            throughput_mode=efs.ThroughputMode.BURSTING,
+            throughput_mode=throughput_mode,
             removal_policy=cdk.RemovalPolicy.DESTROY,
             vpc=vpc,
         )
@@ -268,7 +272,7 @@ class EFSEcosystem(EnvBaseConstruct):
         return self.file_system.as_lambda_file_system(self.root_access_point)
 
 
-@dataclass
+@dataclass(slots=True)
 class MountPointConfiguration:
     """Configuration for mounting an EFS file system.
 
@@ -5,7 +5,7 @@ environments with various configurations.
 """
 
 from abc import abstractmethod
-from collections.abc import Iterable
+from collections.abc import Iterable, Sequence
 
 from aibs_informatics_core.env import EnvBase
 from aws_cdk import aws_batch as batch
@@ -86,17 +86,26 @@ class BaseBatchComputeConstruct(EnvBaseConstruct):
 
         self.create_batch_environments()
 
-        bucket_list = list(buckets or [])
+        # Only materialize a new list when given a non-sequence iterable (e.g. a generator)
+        bucket_list = buckets if isinstance(buckets, (list, tuple)) else list(buckets or [])
 
-        file_system_list = list(file_systems or [])
+        file_system_list = (
+            file_systems if isinstance(file_systems, (list, tuple)) else list(file_systems or [])
+        )
 
         if mount_point_configs:
-            mount_point_config_list = list(mount_point_configs)
+            mount_point_config_list = (
+                mount_point_configs
+                if isinstance(mount_point_configs, (list, tuple))
+                else list(mount_point_configs)
+            )
             file_system_list = self._update_file_systems_from_mount_point_configs(
                 file_system_list, mount_point_config_list
             )
         else:
-            mount_point_config_list = self._get_mount_point_configs(file_system_list)
+            mount_point_config_list = [
+                MountPointConfiguration.from_file_system(fs) for fs in file_system_list
+            ]
 
         # Validation to ensure that the file systems are not duplicated
         self._validate_mount_point_configs(mount_point_config_list)
@@ -119,6 +128,11 @@ class BaseBatchComputeConstruct(EnvBaseConstruct):
 
         Subclasses must implement this to create their specific
         batch environment configurations.
+
+        Note:
+            Environments should be created sequentially. The jsii kernel connection
+            backing every construct call is not thread-safe, so building them from
+            a thread pool would not overlap any work.
         """
         raise NotImplementedError()
 
@@ -142,59 +156,43 @@ class BaseBatchComputeConstruct(EnvBaseConstruct):
         """
         self.batch.grant_instance_role_permissions(read_write_resources=list(resources))
 
+        file_systems = [resource for resource in resources if isinstance(resource, efs.FileSystem)]
+        if not file_systems:
+            return
         for batch_environment in self.batch.environments:
-            for resource in resources:
-                if isinstance(resource, efs.FileSystem):
-                    batch_environment.grant_file_system_access(resource)
+            batch_environment.grant_file_system_access(*file_systems)
 
     def _validate_mount_point_configs(
-        self, mount_point_configs: list[MountPointConfiguration]
+        self, mount_point_configs: Sequence[MountPointConfiguration]
     ) -> None:
         """Validate mount point configurations for duplicates.
 
         Args:
-            mount_point_configs (List[MountPointConfiguration]): Configs to validate.
+            mount_point_configs (Sequence[MountPointConfiguration]): Configs to validate.
 
         Raises:
             ValueError: If duplicate mount points are found.
         """
         _ = {}
         for mpc in mount_point_configs:
-            if mpc.mount_point in _ and _[mpc.mount_point] != mpc:
+            mount_point = mpc.mount_point
+            if mount_point in _ and _[mount_point] != mpc:
                 raise ValueError(
-                    f"Mount point {mpc.mount_point} is duplicated. "
+                    f"Mount point {mount_point} is duplicated. "
                     "Cannot have multiple mount points configurations with the same name."
                 )
-            _[mpc.mount_point] = mpc
-
-    def _get_mount_point_configs(
-        self, file_systems: list[efs.FileSystem | efs.IFileSystem] | None
-    ) -> list[MountPointConfiguration]:
-        """Get mount point configurations from file systems.
-
-        Args:
-            file_systems (Optional[List[Union[efs.FileSystem, efs.IFileSystem]]]):
-                File systems to create mount configs for.
-
-        Returns:
-            List of MountPointConfiguration objects.
-        """
-        mount_point_configs = []
-        if file_systems:
-            for fs in file_systems:
-                mount_point_configs.append(MountPointConfiguration.from_file_system(fs))
-        return mount_point_configs
+            _[mount_point] = mpc
 
     def _update_file_systems_from_mount_point_configs(
         self,
-        file_systems: list[efs.FileSystem | efs.IFileSystem],
-        mount_point_configs: list[MountPointConfiguration],
+        file_systems: Sequence[efs.FileSystem | efs.IFileSystem],
+        mount_point_configs: Sequence[MountPointConfiguration],
     ) -> list[efs.FileSystem | efs.IFileSystem]:
         """Update file systems list from mount point configurations.
 
         Args:
-            file_systems (List[Union[efs.FileSystem, efs.IFileSystem]]): Existing file systems.
-            mount_point_configs (List[MountPointConfiguration]): Mount configs to process.
+            file_systems (Sequence[Union[efs.FileSystem, efs.IFileSystem]]): Existing file systems.
+            mount_point_configs (Sequence[MountPointConfiguration]): Mount configs to process.
 
         Returns:
             Updated list of file systems.
@@ -206,11 +204,13 @@ class BaseBatchComputeConstruct(EnvBaseConstruct):
             fs.file_system_id: fs for fs in file_systems
         }
         for mpc in mount_point_configs:
-            if mpc.file_system_id not in file_system_map:
+            # file_system_id resolves through the jsii kernel, so look it up once
+            file_system_id = mpc.file_system_id
+            if file_system_id not in file_system_map:
                 if not mpc.file_system and mpc.access_point:
-                    file_system_map[mpc.file_system_id] = mpc.access_point.file_system
+                    file_system_map[file_system_id] = mpc.access_point.file_system
                 elif mpc.file_system:
-                    file_system_map[mpc.file_system_id] = mpc.file_system
+                    file_system_map[file_system_id] = mpc.file_system
                 else:
                     raise ValueError(
                         "Mount point configuration must have a file system or access point."
@@ -249,7 +249,7 @@ class BatchCompute(BaseBatchComputeConstruct):
             descriptor=BatchEnvironmentDescriptor(f"{self.name}-on-demand"),
             config=BatchEnvironmentConfig(
                 allocation_strategy=batch.AllocationStrategy.BEST_FIT,
-                instance_types=[ec2.InstanceType(_) for _ in ON_DEMAND_INSTANCE_TYPES],
+                instance_types=[*ON_DEMAND_INSTANCE_TYPES],
                 use_spot=False,
                 use_fargate=False,
                 use_public_subnets=False,
@@ -261,7 +261,7 @@ class BatchCompute(BaseBatchComputeConstruct):
             descriptor=BatchEnvironmentDescriptor(f"{self.name}-spot"),
             config=BatchEnvironmentConfig(
                 allocation_strategy=batch.AllocationStrategy.SPOT_PRICE_CAPACITY_OPTIMIZED,
-                instance_types=[ec2.InstanceType(_) for _ in SPOT_INSTANCE_TYPES],
+                instance_types=[*SPOT_INSTANCE_TYPES],
                 use_spot=True,
                 use_fargate=False,
                 use_public_subnets=False,
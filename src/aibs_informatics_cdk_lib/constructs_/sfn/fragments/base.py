@@ -26,6 +26,23 @@ T = TypeVar("T", bound=ValidatedStr)
 F = TypeVar("F", bound="StateMachineFragment")
 
 
+def _create_log_group(
+    scope: constructs.Construct,
+    id: str,
+    log_group_name: str,
+    removal_policy: cdk.RemovalPolicy | None = None,
+    retention: logs_.RetentionDays | None = None,
+) -> logs_.LogGroup:
+    """Create a state machine log group (DESTROY removal, ONE_MONTH retention by default)."""
+    return logs_.LogGroup(
+        scope,
+        id,
+        log_group_name=log_group_name,
+        removal_policy=removal_policy or cdk.RemovalPolicy.DESTROY,
+        retention=retention or logs_.RetentionDays.ONE_MONTH,
+    )
+
+
 def create_log_options(
     scope: constructs.Construct,
     id: str,
@@ -48,12 +65,12 @@ def create_log_options(
         Log options configured with a CloudWatch log group.
     """
     return sfn.LogOptions(
-        destination=logs_.LogGroup(
+        destination=_create_log_group(
             scope,
             env_base.get_construct_id(id, "state-loggroup"),
             log_group_name=env_base.get_state_machine_log_group_name(id),
-            removal_policy=removal_policy or cdk.RemovalPolicy.DESTROY,
-            retention=retention or logs_.RetentionDays.ONE_MONTH,
+            removal_policy=removal_policy,
+            retention=retention,
         )
     )
 
@@ -217,12 +234,10 @@ def create_state_machine(
         logs=(
             logs
             or sfn.LogOptions(
-                destination=logs_.LogGroup(
+                destination=_create_log_group(
                     scope,
                     env_base.get_construct_id(id, "state-loggroup"),
                     log_group_name=env_base.get_state_machine_log_group_name(name or id),
-                    removal_policy=cdk.RemovalPolicy.DESTROY,
-                    retention=logs_.RetentionDays.ONE_MONTH,
                 )
             )
         ),
@@ -439,9 +454,7 @@ class EnvBaseStateMachineFragment(StateMachineFragment, StateMachineMixins):
             self.get_construct_id(state_machine_name),
             state_machine_name=self.env_base.get_state_machine_name(state_machine_name),
             logs=logs or create_log_options(self, state_machine_name, self.env_base),
-            role=(
-                role if role is not None else create_role(self, state_machine_name, self.env_base)
-            ),  # type: ignore[arg-type]
+            role=role,  # type: ignore[arg-type]
             definition_body=sfn.DefinitionBody.from_chainable(self.definition),
             timeout=timeout,
         )
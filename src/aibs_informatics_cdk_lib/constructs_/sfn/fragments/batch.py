@@ -1,9 +1,9 @@
 from collections.abc import Mapping
+from functools import cache
 from typing import TYPE_CHECKING, Any, Literal, cast
 
 import constructs
 from aibs_informatics_core.env import EnvBase
-from aibs_informatics_core.utils.tools.dicttools import convert_key_case
 from aibs_informatics_core.utils.tools.strtools import pascalcase
 from aws_cdk import JsonNull
 from aws_cdk import aws_stepfunctions as sfn
@@ -19,6 +19,61 @@ else:  # pragma: no cover
     MountPointTypeDef = dict
     VolumeTypeDef = dict
 
+# PascalCase keys of the Batch mount point / volume schemas, precomputed to avoid
+# running the regex-based `pascalcase` on every key of every mount point config.
+_BATCH_VOLUME_KEY_MAP: dict[str, str] = {
+    key: key[0].upper() + key[1:]
+    for key in (
+        # MountPoint
+        "containerPath",
+        "readOnly",
+        "sourceVolume",
+        # Volume
+        "name",
+        "host",
+        "sourcePath",
+        "efsVolumeConfiguration",
+        "fileSystemId",
+        "rootDirectory",
+        "transitEncryption",
+        "transitEncryptionPort",
+        "authorizationConfig",
+        "accessPointId",
+        "iam",
+    )
+}
+
+
+def _to_pascal_key(key: str) -> str:
+    return _BATCH_VOLUME_KEY_MAP.get(key) or pascalcase(key)
+
+
+def _to_pascal_keys(data: Any) -> Any:
+    """Recursively convert the keys of a Batch mount point / volume to PascalCase.
+
+    Equivalent to `convert_key_case(data, pascalcase)`, recursing into nested mappings and
+    lists (tuples too), but looking up known keys in the precomputed mapping and only
+    falling back to `pascalcase` for keys missing from it.
+    """
+    if isinstance(data, Mapping):
+        return {
+            (_to_pascal_key(k) if isinstance(k, str) else k): _to_pascal_keys(v)
+            for k, v in data.items()
+        }
+    elif isinstance(data, (list, tuple)):
+        return type(data)(_to_pascal_keys(item) for item in data)
+    return data
+
+
+@cache
+def _request_path(key: str) -> str:
+    """Get the (cached) JsonPath token referencing a field of the merged `$.request` payload.
+
+    JsonPath tokens resolve to the same literal path regardless of the stack they are
+    used in, so a single token per key can be shared across fragments.
+    """
+    return sfn.JsonPath.string_at(f"$.request.{key}")
+
 
 class AWSBatchMixins:
     @classmethod
@@ -29,10 +84,9 @@ class AWSBatchMixins:
         mount_points = []
         volumes = []
         for i, mpc in enumerate(mount_point_configs):
-            mount_points.append(
-                convert_key_case(mpc.to_batch_mount_point(f"efs-vol{i}"), pascalcase)
-            )
-            volumes.append(convert_key_case(mpc.to_batch_volume(f"efs-vol{i}"), pascalcase))
+            volume_name = f"efs-vol{i}"
+            mount_points.append(_to_pascal_keys(mpc.to_batch_mount_point(volume_name)))
+            volumes.append(_to_pascal_keys(mpc.to_batch_volume(volume_name)))
         return cast(tuple[list[MountPointTypeDef], list[VolumeTypeDef]], (mount_points, volumes))
 
 
@@ -57,6 +111,8 @@ class SubmitJobFragment(EnvBaseStateMachineFragment, AWSBatchMixins):
     ) -> None:
         super().__init__(scope, id, env_base)
 
+        job_definition_arn = sfn.JsonPath.string_at("$.taskResult.register.JobDefinitionArn")
+
         register_chain = BatchOperation.register_job_definition(
             self,
             id,
@@ -76,7 +132,7 @@ class SubmitJobFragment(EnvBaseStateMachineFragment, AWSBatchMixins):
             self,
             id,
             job_name=name,
-            job_definition=sfn.JsonPath.string_at("$.taskResult.register.JobDefinitionArn"),
+            job_definition=job_definition_arn,
             job_queue=job_queue,
             command=command,
             environment=environment,
@@ -88,13 +144,13 @@ class SubmitJobFragment(EnvBaseStateMachineFragment, AWSBatchMixins):
         deregister_chain = BatchOperation.deregister_job_definition(
             self,
             id,
-            job_definition=sfn.JsonPath.string_at("$.taskResult.register.JobDefinitionArn"),
+            job_definition=job_definition_arn,
         )
 
         try_catch_deregister_chain = BatchOperation.deregister_job_definition(
             self,
             id + " FAIL",
-            job_definition=sfn.JsonPath.string_at("$.taskResult.register.JobDefinitionArn"),
+            job_definition=job_definition_arn,
         )
 
         register = CommonOperation.enclose_chainable(
@@ -145,16 +201,17 @@ class SubmitJobFragment(EnvBaseStateMachineFragment, AWSBatchMixins):
         mount_point_configs: list[MountPointConfiguration] | None = None,
         job_role_arn: str | None = None,
     ) -> "SubmitJobFragment":
-        defaults: dict[str, Any] = {}
-        defaults["command"] = command
-        defaults["job_queue"] = job_queue
-        defaults["environment"] = environment or {}
-        defaults["image"] = image
-        defaults["memory"] = str(memory)
-        defaults["vcpus"] = str(vcpus)
-        defaults["gpu"] = str(gpu)
-        defaults["platform_capabilities"] = ["EC2"]
-        defaults["job_role_arn"] = job_role_arn or JsonNull.INSTANCE
+        defaults: dict[str, Any] = {
+            "command": command,
+            "job_queue": job_queue,
+            "environment": environment or {},
+            "image": image,
+            "memory": str(memory),
+            "vcpus": str(vcpus),
+            "gpu": str(gpu),
+            "platform_capabilities": ["EC2"],
+            "job_role_arn": job_role_arn or JsonNull.INSTANCE,
+        }
 
         if mount_point_configs:
             mount_points, volumes = cls.convert_to_mount_point_and_volumes(mount_point_configs)
@@ -166,17 +223,17 @@ class SubmitJobFragment(EnvBaseStateMachineFragment, AWSBatchMixins):
             id,
             env_base=env_base,
             name=name,
-            image=sfn.JsonPath.string_at("$.request.image"),
-            command=sfn.JsonPath.string_at("$.request.command"),
-            job_queue=sfn.JsonPath.string_at("$.request.job_queue"),
-            environment=sfn.JsonPath.string_at("$.request.environment"),
-            memory=sfn.JsonPath.string_at("$.request.memory"),
-            vcpus=sfn.JsonPath.string_at("$.request.vcpus"),
-            gpu=sfn.JsonPath.string_at("$.request.gpu"),
-            mount_points=sfn.JsonPath.string_at("$.request.mount_points"),
-            volumes=sfn.JsonPath.string_at("$.request.volumes"),
-            platform_capabilities=sfn.JsonPath.string_at("$.request.platform_capabilities"),
-            job_role_arn=sfn.JsonPath.string_at("$.request.job_role_arn"),
+            image=_request_path("image"),
+            command=_request_path("command"),
+            job_queue=_request_path("job_queue"),
+            environment=_request_path("environment"),
+            memory=_request_path("memory"),
+            vcpus=_request_path("vcpus"),
+            gpu=_request_path("gpu"),
+            mount_points=_request_path("mount_points"),
+            volumes=_request_path("volumes"),
+            platform_capabilities=_request_path("platform_capabilities"),
+            job_role_arn=_request_path("job_role_arn"),
         )
 
         # Now we need to add the start and merge states and add to the definition
@@ -15,6 +15,7 @@ from aibs_informatics_cdk_lib.common.aws.iam_utils import (
 )
 from aibs_informatics_cdk_lib.constructs_.base import EnvBaseConstructMixins
 from aibs_informatics_cdk_lib.constructs_.efs.file_system import MountPointConfiguration
+from aibs_informatics_cdk_lib.constructs_.sfn.fragments.batch import AWSBatchMixins
 from aibs_informatics_cdk_lib.constructs_.sfn.fragments.informatics.batch import (
     BatchInvokedBaseFragment,
     BatchInvokedLambdaFunction,
@@ -121,7 +122,7 @@ class DataSyncFragment(BatchInvokedBaseFragment, EnvBaseConstructMixins):
         ]
 
 
-class DistributedDataSyncFragment(BatchInvokedBaseFragment):
+class DistributedDataSyncFragment(BatchInvokedBaseFragment, AWSBatchMixins):
     def __init__(
         self,
         scope: constructs.Construct,
@@ -132,6 +133,9 @@ class DistributedDataSyncFragment(BatchInvokedBaseFragment):
         scaffolding_bucket: s3.Bucket,
         batch_job_role: str | iam.Role | None = None,
         mount_point_configs: Iterable[MountPointConfiguration] | None = None,
+        batch_data_sync_memory: int = 4096,
+        batch_data_sync_vcpus: int = 2,
+        use_distributed_map: bool = False,
     ) -> None:
         """Sync data from one s3 bucket to another using distributed batch jobs
 
@@ -150,8 +154,38 @@ class DistributedDataSyncFragment(BatchInvokedBaseFragment):
                 used.
             mount_point_configs (Optional[Iterable[MountPointConfiguration]], optional):
                 List of mount point configurations to use. These can be overridden in the payload.
+            batch_data_sync_memory (int, optional): Memory in MiB for each batch data sync job.
+                Defaults to 4096.
+            batch_data_sync_vcpus (int, optional): Number of vCPUs for each batch data sync job.
+                Defaults to 2.
+            use_distributed_map (bool, optional): Run each batch sync request as a child
+                execution of a distributed map instead of an inline map iteration. Requires a
+                STANDARD state machine, and `$$.Execution` then refers to the child execution.
+                Defaults to False.
         """
         super().__init__(scope, id, env_base)
+
+        # Resolve arguments shared by the prep and batch sync functions once
+        aibs_informatics_image_uri = (
+            aibs_informatics_docker_asset
+            if isinstance(aibs_informatics_docker_asset, str)
+            else aibs_informatics_docker_asset.image_uri
+        )
+        batch_job_queue_name = (
+            batch_job_queue if isinstance(batch_job_queue, str) else batch_job_queue.job_queue_name
+        )
+        batch_job_role_arn = (
+            (batch_job_role if isinstance(batch_job_role, str) else batch_job_role.role_arn)
+            if batch_job_role
+            else None
+        )
+        # Both functions share the same mounts, so convert them to batch format only once
+        mount_points, volumes = (
+            self.convert_to_mount_point_and_volumes(list(mount_point_configs))
+            if mount_point_configs
+            else (None, None)
+        )
+
         start_pass_state = sfn.Pass(
             self,
             f"{id}: Start",
@@ -167,65 +201,55 @@ class DistributedDataSyncFragment(BatchInvokedBaseFragment):
             env_base=env_base,
             name=prep_batch_sync_task_name,
             payload_path="$.request",
-            image=(
-                aibs_informatics_docker_asset
-                if isinstance(aibs_informatics_docker_asset, str)
-                else aibs_informatics_docker_asset.image_uri
-            ),
+            image=aibs_informatics_image_uri,
             handler="aibs_informatics_aws_lambda.handlers.data_sync.prepare_batch_data_sync_handler",
-            job_queue=(
-                batch_job_queue
-                if isinstance(batch_job_queue, str)
-                else batch_job_queue.job_queue_name
-            ),
+            job_queue=batch_job_queue_name,
             bucket_name=scaffolding_bucket.bucket_name,
             memory=1024,
             vcpus=1,
-            mount_point_configs=list(mount_point_configs) if mount_point_configs else None,
-            job_role_arn=(
-                batch_job_role if isinstance(batch_job_role, str) else batch_job_role.role_arn
-            )
-            if batch_job_role
-            else None,
+            mount_points=mount_points,
+            volumes=volumes,
+            job_role_arn=batch_job_role_arn,
         ).enclose(result_path=f"$.tasks.{prep_batch_sync_task_name}.response")
 
-        batch_sync_map_state = sfn.Map(
-            self,
-            f"{id}: Batch Data Sync: Map Start",
-            comment="Runs requests for batch sync in parallel",
-            items_path=f"$.tasks.{prep_batch_sync_task_name}.response.requests",
-            result_path=sfn.JsonPath.DISCARD,
+        batch_sync = BatchInvokedLambdaFunction(
+            scope=scope,
+            id=f"{id}: Batch Data Sync",
+            env_base=env_base,
+            name="batch-data-sync",
+            payload_path="$",
+            image=aibs_informatics_image_uri,
+            handler="aibs_informatics_aws_lambda.handlers.data_sync.batch_data_sync_handler",
+            job_queue=batch_job_queue_name,
+            bucket_name=scaffolding_bucket.bucket_name,
+            memory=batch_data_sync_memory,
+            vcpus=batch_data_sync_vcpus,
+            mount_points=mount_points,
+            volumes=volumes,
+            job_role_arn=batch_job_role_arn,
         )
 
-        batch_sync_map_state.iterator(
-            BatchInvokedLambdaFunction(
-                scope=scope,
-                id=f"{id}: Batch Data Sync",
-                env_base=env_base,
-                name="batch-data-sync",
-                payload_path="$",
-                image=(
-                    aibs_informatics_docker_asset
-                    if isinstance(aibs_informatics_docker_asset, str)
-                    else aibs_informatics_docker_asset.image_uri
-                ),
-                handler="aibs_informatics_aws_lambda.handlers.data_sync.batch_data_sync_handler",
-                job_queue=(
-                    batch_job_queue
-                    if isinstance(batch_job_queue, str)
-                    else batch_job_queue.job_queue_name
-                ),
-                bucket_name=scaffolding_bucket.bucket_name,
-                memory=4096,
-                vcpus=2,
-                mount_point_configs=list(mount_point_configs) if mount_point_configs else None,
-                job_role_arn=(
-                    batch_job_role if isinstance(batch_job_role, str) else batch_job_role.role_arn
-                )
-                if batch_job_role
-                else None,
+        batch_sync_map_state: sfn.Map | sfn.DistributedMap
+        if use_distributed_map:
+            # The state machine construct grants its role permission to run child executions
+            batch_sync_map_state = sfn.DistributedMap(
+                self,
+                f"{id}: Batch Data Sync: Map Start",
+                comment="Runs requests for batch sync in parallel",
+                items_path=f"$.tasks.{prep_batch_sync_task_name}.response.requests",
+                result_path=sfn.JsonPath.DISCARD,
             )
-        )
+            batch_sync_map_state.item_processor(batch_sync)
+        else:
+            batch_sync_map_state = sfn.Map(
+                self,
+                f"{id}: Batch Data Sync: Map Start",
+                comment="Runs requests for batch sync in parallel",
+                items_path=f"$.tasks.{prep_batch_sync_task_name}.response.requests",
+                result_path=sfn.JsonPath.DISCARD,
+            )
+            batch_sync_map_state.iterator(batch_sync)
+
         # fmt: off
         self.definition = (
             start_pass_state
@@ -293,17 +293,22 @@ class BaseProjectConfig(BaseModel, Generic[G, S]):
         Raises:
             Exception: If stage config model validation fails.
         """
-        try:
-            stage_config = self.get_stage_config_cls().model_validate(
-                {
-                    **DeepChainMap(
-                        self.default_config_overrides[EnvType(env_type)],
-                        self.default_config.model_dump(mode="json", exclude_unset=True),
-                    ),
-                }
-            )
-        except Exception as e:
-            raise e
+        overrides = self.default_config_overrides[EnvType(env_type)]
+        if not overrides:
+            # Nothing to merge, so skip re-validating the already validated default config
+            stage_config = self.default_config.model_copy(deep=True)
+        else:
+            try:
+                stage_config = self.get_stage_config_cls().model_validate(
+                    {
+                        **DeepChainMap(
+                            overrides,
+                            self.default_config.model_dump(mode="json", exclude_unset=True),
+                        ),
+                    }
+                )
+            except Exception as e:
+                raise e
 
         if env_label is None:
             return stage_config
@@ -327,7 +332,7 @@ class BaseProjectConfig(BaseModel, Generic[G, S]):
         if path.suffix in (".yml", ".yaml"):
             with open(path) as f:
                 return cls.model_validate(yaml.safe_load(f))
-        return cls.model_validate_json(json_data=path.read_text())
+        return cls.model_validate_json(json_data=path.read_bytes())
 
     @classmethod
     def load_config(cls: type[P], path: str | Path | None = None) -> P:
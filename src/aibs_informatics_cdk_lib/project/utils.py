@@ -8,6 +8,7 @@ __all__ = [
 import logging
 import os
 import pathlib
+from functools import cache
 from typing import cast
 
 import constructs
@@ -43,11 +44,14 @@ def resolve_repo_root(start_path: str | pathlib.Path | None = None) -> str:
     )
 
 
+@cache
 def get_package_root() -> str:
     """Find the root package
 
     ASSUMPTION: the infrastructure package name is "aibs-informatics-cdk-lib"
 
+    The result is cached, as the location of this module does not change within a process.
+
     Returns:
         Absolute root path
     """
@@ -1,4 +1,5 @@
 from aibs_informatics_core.env import EnvBase
+from aws_cdk import aws_efs as efs
 from constructs import Construct
 
 from aibs_informatics_cdk_lib.constructs_.ec2.network import EnvBaseVpc
@@ -14,10 +15,12 @@ class CoreStack(EnvBaseStack):
         id: str | None,
         env_base: EnvBase,
         name: str,
+        vpc: EnvBaseVpc | None = None,
         **kwargs,
     ) -> None:
         super().__init__(scope, id, env_base, **kwargs)
-        self._vpc = EnvBaseVpc(self, "Vpc", self.env_base, max_azs=4)
+        # Reuse a VPC defined elsewhere rather than synthesizing a second one
+        self._vpc = vpc or EnvBaseVpc(self, "Vpc", self.env_base, max_azs=4)
 
         self._bucket = EnvBaseBucket(
             self,
@@ -33,7 +36,13 @@ class CoreStack(EnvBaseStack):
         )
 
         self._efs_ecosystem = EFSEcosystem(
-            self, id="EFS", env_base=self.env_base, file_system_name=name, vpc=self.vpc
+            self,
+            id="EFS",
+            env_base=self.env_base,
+            file_system_name=name,
+            vpc=self.vpc,
+            # Data syncs read and write in bursts, which can drain burst credits
+            throughput_mode=efs.ThroughputMode.ELASTIC,
         )
         self._file_system = self._efs_ecosystem.file_system
 
@@ -1,3 +1,6 @@
+from collections import Counter
+from collections.abc import Mapping
+
 import aws_cdk as cdk
 from aibs_informatics_core.env import ENV_BASE_KEY, EnvBase, EnvType
 from aibs_informatics_test_resources import BaseTest as _BaseTest
@@ -29,7 +32,13 @@ class CdkBaseTest(BaseTest):
         try:
             return self._app
         except AttributeError:
-            self.app = cdk.App()
+            self.app = cdk.App(
+                analytics_reporting=False,
+                context={
+                    "aws:cdk:bundling-stacks": [],
+                    "aws:cdk:disable-stack-trace": True,
+                },
+            )
         return self.app
 
     @app.setter
@@ -37,7 +46,24 @@ class CdkBaseTest(BaseTest):
         self._app = app
 
     def get_template(self, stack: cdk.Stack) -> Template:
-        return Template.from_stack(stack)
+        """Synthesize the template of a stack, reusing it for repeated calls within a test.
+
+        Stacks must be fully constructed before their template is first requested.
+        """
+        try:
+            templates: dict[cdk.Stack, Template] = self._templates
+        except AttributeError:
+            templates = self._templates = {}
+        # Keyed on the stack itself: node.path and node.addr repeat across apps. CDK rejects
+        # changes to the construct tree after the first synth, so a template cannot go stale.
+        if stack not in templates:
+            templates[stack] = Template.from_stack(stack)
+        return templates[stack]
+
+    def assert_resource_counts(self, template: Template, expected: Mapping[str, int]):
+        """Assert the number of resources of each given type, counting all of them in one pass."""
+        counts = Counter(r["Type"] for r in template.to_json().get("Resources", {}).values())
+        self.assertDictEqual({t: counts[t] for t in expected}, dict(expected))
 
     def get_dummy_construct(self, name: str, stack: cdk.Stack | None = None) -> EnvBaseConstruct:
         stack = stack or self.get_dummy_stack(name)
@@ -0,0 +1,10 @@
+import aws_cdk as cdk
+
+REGION = cdk.Aws.REGION
+ACCOUNT_ID = cdk.Aws.ACCOUNT_ID
+
+
+def aws_arn(
+    service: str, resource: str = "*", region: str = REGION, account: str = ACCOUNT_ID
+) -> str:
+    return f"arn:aws:{service}:{region}:{account}:{resource}"
@@ -1,22 +1,22 @@
-import aws_cdk as cdk
 import pytest
 
 from aibs_informatics_cdk_lib.common.aws.core_utils import build_arn
+from test.aibs_informatics_cdk_lib.common.aws.base import aws_arn
 
 build_arn_test_cases = [
     pytest.param(
         dict(service="s3"),
-        f"arn:aws:s3:{cdk.Aws.REGION}:{cdk.Aws.ACCOUNT_ID}:*",
+        aws_arn("s3"),
         id="Default",
     ),
     pytest.param(
         dict(service="s3", resource_type="Fetch", resource_id="Blah"),
-        f"arn:aws:s3:{cdk.Aws.REGION}:{cdk.Aws.ACCOUNT_ID}:Fetch:Blah",
+        aws_arn("s3", "Fetch:Blah"),
         id="Defaults with resource type:id",
     ),
     pytest.param(
         dict(service="s3", resource_type="Fetch", resource_id="Blah", resource_delim="/"),
-        f"arn:aws:s3:{cdk.Aws.REGION}:{cdk.Aws.ACCOUNT_ID}:Fetch/Blah",
+        aws_arn("s3", "Fetch/Blah"),
         id="Defaults with resource type/id",
     ),
 ]
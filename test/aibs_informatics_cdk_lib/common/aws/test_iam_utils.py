@@ -1,6 +1,5 @@
 import re
 
-import aws_cdk as cdk
 import pytest
 from aibs_informatics_core.env import EnvBase
 
@@ -11,6 +10,7 @@ from aibs_informatics_cdk_lib.common.aws.iam_utils import (
     secretsmanager_policy_statement,
     sqs_policy_statement,
 )
+from test.aibs_informatics_cdk_lib.common.aws.base import aws_arn
 
 
 def test_secretsmanager_policy_statement_default():
@@ -18,20 +18,18 @@ def test_secretsmanager_policy_statement_default():
 
     assert statement.to_statement_json()["Effect"] == "Allow"
     assert set(statement.actions) == set(SECRETSMANAGER_READ_ONLY_ACTIONS)
-    assert statement.resources == [
-        f"arn:aws:secretsmanager:{cdk.Aws.REGION}:{cdk.Aws.ACCOUNT_ID}:*"
-    ]
+    assert statement.resources == [aws_arn("secretsmanager")]
 
 
 generate_policy_test_cases = [
     pytest.param(
         dict(resource_id="airflow/connections/*"),
-        f"arn:aws:secretsmanager:{cdk.Aws.REGION}:{cdk.Aws.ACCOUNT_ID}:airflow/connections/*",
+        aws_arn("secretsmanager", "airflow/connections/*"),
         SECRETSMANAGER_READ_ONLY_ACTIONS,
     ),
     pytest.param(
         dict(resource_id="my-secret", region="*"),
-        f"arn:aws:secretsmanager:*:{cdk.Aws.ACCOUNT_ID}:my-secret",
+        aws_arn("secretsmanager", "my-secret", region="*"),
         SECRETSMANAGER_READ_ONLY_ACTIONS,
     ),
     pytest.param(
@@ -40,7 +38,7 @@ generate_policy_test_cases = [
             account="123456789012",
             actions=SECRETSMANAGER_READ_WRITE_ACTIONS,
         ),
-        f"arn:aws:secretsmanager:{cdk.Aws.REGION}:123456789012:stage/db-password",
+        aws_arn("secretsmanager", "stage/db-password", account="123456789012"),
         SECRETSMANAGER_READ_WRITE_ACTIONS,
     ),
 ]
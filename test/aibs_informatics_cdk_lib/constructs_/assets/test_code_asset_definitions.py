@@ -0,0 +1,38 @@
+import os
+
+from aibs_informatics_test_resources import BaseTest
+
+from aibs_informatics_cdk_lib.constructs_.assets.code_asset_definitions import (
+    _generate_repo_hash,
+)
+
+
+class GenerateRepoHashTests(BaseTest):
+    def test__generate_repo_hash__reused_until_repo_files_change(self):
+        repo_path = self.tmp_path()
+        source = repo_path / "src" / "module.py"
+        source.parent.mkdir(parents=True)
+        source.write_text("x = 1\n")
+
+        original_hash = _generate_repo_hash(str(repo_path))
+        self.assertEqual(_generate_repo_hash(str(repo_path)), original_hash)
+
+        # Same size, so only the modification time tells the file apart
+        source.write_text("x = 2\n")
+        stat = source.stat()
+        os.utime(source, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        modified_hash = _generate_repo_hash(str(repo_path))
+        self.assertNotEqual(modified_hash, original_hash)
+
+        (repo_path / "src" / "other.py").write_text("y = 1\n")
+        self.assertNotEqual(_generate_repo_hash(str(repo_path)), modified_hash)
+
+    def test__generate_repo_hash__ignores_excluded_files(self):
+        repo_path = self.tmp_path()
+        (repo_path / "module.py").write_text("x = 1\n")
+        original_hash = _generate_repo_hash(str(repo_path))
+
+        (repo_path / "__pycache__").mkdir()
+        (repo_path / "__pycache__" / "module.cpython-311.pyc").write_bytes(b"\x00")
+
+        self.assertEqual(_generate_repo_hash(str(repo_path)), original_hash)
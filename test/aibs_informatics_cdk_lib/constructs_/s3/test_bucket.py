@@ -1,10 +1,21 @@
+from typing import cast
+
+import aws_cdk as cdk
 from aws_cdk import aws_iam as iam
-from aws_cdk.assertions import Match
+from aws_cdk import aws_s3 as s3
+from aws_cdk.assertions import Match, Matcher
 
 from aibs_informatics_cdk_lib.constructs_.s3.bucket import EnvBaseBucket
 from test.aibs_informatics_cdk_lib.base import CdkBaseTest
 
 
+def _bucket_resources_matcher(bucket: s3.Bucket, objects_suffix: str) -> Matcher:
+    """Match policy resources granting access to a bucket and its objects (`<bucket arn>/*`)"""
+    bucket_resource = cast(cdk.CfnResource, bucket.node.default_child)
+    bucket_arn = {"Fn::GetAtt": [bucket.stack.get_logical_id(bucket_resource), "Arn"]}
+    return Match.array_with([bucket_arn, {"Fn::Join": ["", [bucket_arn, objects_suffix]]}])
+
+
 class TestBucket(CdkBaseTest):
     def test__grant_permissions__with_key_pattern(self):
         stack = self.get_dummy_stack("test")
@@ -23,111 +34,63 @@ class TestBucket(CdkBaseTest):
 
         template.resource_count_is("AWS::IAM::Policy", 2)
 
-        bucket_arn_match = Match.object_like({"Fn::GetAtt": [Match.any_value(), "Arn"]})
-
         template.has_resource_properties(
             "AWS::IAM::Policy",
-            Match.object_like(
-                {
-                    "PolicyDocument": Match.object_like(
-                        {
-                            "Statement": Match.array_with(
-                                [
-                                    Match.object_like(
-                                        {
-                                            "Action": [
-                                                "s3:GetObject*",
-                                                "s3:GetBucket*",
-                                                "s3:List*",
-                                            ],
-                                            "Effect": "Allow",
-                                            "Resource": Match.array_with(
-                                                [
-                                                    bucket_arn_match,
-                                                    Match.object_like(
-                                                        {
-                                                            "Fn::Join": Match.array_with(
-                                                                [
-                                                                    "",
-                                                                    Match.array_with(
-                                                                        [
-                                                                            bucket_arn_match,
-                                                                            "/*",
-                                                                        ]
-                                                                    ),
-                                                                ]
-                                                            )
-                                                        }
-                                                    ),
-                                                ]
-                                            ),
-                                        }
-                                    )
-                                ]
-                            ),
-                            "Version": "2012-10-17",
-                        }
+            {
+                "PolicyDocument": {
+                    "Statement": Match.array_with(
+                        [
+                            Match.object_like(
+                                {
+                                    "Action": [
+                                        "s3:GetObject*",
+                                        "s3:GetBucket*",
+                                        "s3:List*",
+                                    ],
+                                    "Effect": "Allow",
+                                    "Resource": _bucket_resources_matcher(bucket, "/*"),
+                                }
+                            )
+                        ]
                     ),
-                    "PolicyName": "rolePolicy0555B62D",
-                    "Roles": ["my-role-1"],
-                }
-            ),
+                },
+                "PolicyName": "rolePolicy0555B62D",
+                "Roles": ["my-role-1"],
+            },
         )
 
         template.has_resource_properties(
             "AWS::IAM::Policy",
-            Match.object_like(
-                {
-                    "PolicyDocument": Match.object_like(
-                        {
-                            "Statement": Match.array_with(
-                                [
-                                    Match.object_like(
-                                        {
-                                            "Action": [
-                                                "s3:GetObject*",
-                                                "s3:GetBucket*",
-                                                "s3:List*",
-                                                "s3:DeleteObject*",
-                                                "s3:PutObject",
-                                                "s3:PutObjectLegalHold",
-                                                "s3:PutObjectRetention",
-                                                "s3:PutObjectTagging",
-                                                "s3:PutObjectVersionTagging",
-                                                "s3:Abort*",
-                                            ],
-                                            "Effect": "Allow",
-                                            "Resource": Match.array_with(
-                                                [
-                                                    bucket_arn_match,
-                                                    Match.object_like(
-                                                        {
-                                                            "Fn::Join": Match.array_with(
-                                                                [
-                                                                    "",
-                                                                    Match.array_with(
-                                                                        [
-                                                                            bucket_arn_match,
-                                                                            "/another/path/*",
-                                                                        ]
-                                                                    ),
-                                                                ]
-                                                            )
-                                                        }
-                                                    ),
-                                                ]
-                                            ),
-                                        }
-                                    )
-                                ]
-                            ),
-                            "Version": "2012-10-17",
-                        }
+            {
+                "PolicyDocument": {
+                    "Statement": Match.array_with(
+                        [
+                            Match.object_like(
+                                {
+                                    "Action": [
+                                        "s3:GetObject*",
+                                        "s3:GetBucket*",
+                                        "s3:List*",
+                                        "s3:DeleteObject*",
+                                        "s3:PutObject",
+                                        "s3:PutObjectLegalHold",
+                                        "s3:PutObjectRetention",
+                                        "s3:PutObjectTagging",
+                                        "s3:PutObjectVersionTagging",
+                                        "s3:Abort*",
+                                    ],
+                                    "Effect": "Allow",
+                                    "Resource": _bucket_resources_matcher(
+                                        bucket, "/another/path/*"
+                                    ),
+                                }
+                            )
+                        ]
                     ),
-                    "PolicyName": "role2PolicyF053F9CA",
-                    "Roles": ["my-role-2"],
-                }
-            ),
+                },
+                "PolicyName": "role2PolicyF053F9CA",
+                "Roles": ["my-role-2"],
+            },
         )
 
     def test__grant_permissions__no_role(self):
@@ -153,60 +116,34 @@ class TestBucket(CdkBaseTest):
 
         template.resource_count_is("AWS::IAM::Policy", 1)
 
-        bucket_arn_match = Match.object_like({"Fn::GetAtt": [Match.any_value(), "Arn"]})
-
         template.has_resource_properties(
             "AWS::IAM::Policy",
-            Match.object_like(
-                {
-                    "PolicyDocument": Match.object_like(
-                        {
-                            "Statement": Match.array_with(
-                                [
-                                    Match.object_like(
-                                        {
-                                            "Action": [
-                                                "s3:GetObject*",
-                                                "s3:GetBucket*",
-                                                "s3:List*",
-                                                "s3:DeleteObject*",
-                                                "s3:PutObject",
-                                                "s3:PutObjectLegalHold",
-                                                "s3:PutObjectRetention",
-                                                "s3:PutObjectTagging",
-                                                "s3:PutObjectVersionTagging",
-                                                "s3:Abort*",
-                                            ],
-                                            "Effect": "Allow",
-                                            "Resource": Match.array_with(
-                                                [
-                                                    bucket_arn_match,
-                                                    Match.object_like(
-                                                        {
-                                                            "Fn::Join": Match.array_with(
-                                                                [
-                                                                    "",
-                                                                    Match.array_with(
-                                                                        [
-                                                                            bucket_arn_match,
-                                                                            "/*",
-                                                                        ]
-                                                                    ),
-                                                                ]
-                                                            )
-                                                        }
-                                                    ),
-                                                ]
-                                            ),
-                                        }
-                                    )
-                                ]
-                            ),
-                            "Version": "2012-10-17",
-                        }
+            {
+                "PolicyDocument": {
+                    "Statement": Match.array_with(
+                        [
+                            Match.object_like(
+                                {
+                                    "Action": [
+                                        "s3:GetObject*",
+                                        "s3:GetBucket*",
+                                        "s3:List*",
+                                        "s3:DeleteObject*",
+                                        "s3:PutObject",
+                                        "s3:PutObjectLegalHold",
+                                        "s3:PutObjectRetention",
+                                        "s3:PutObjectTagging",
+                                        "s3:PutObjectVersionTagging",
+                                        "s3:Abort*",
+                                    ],
+                                    "Effect": "Allow",
+                                    "Resource": _bucket_resources_matcher(bucket, "/*"),
+                                }
+                            )
+                        ]
                     ),
-                    "PolicyName": "rolePolicy0555B62D",
-                    "Roles": ["my-role"],
-                }
-            ),
+                },
+                "PolicyName": "rolePolicy0555B62D",
+                "Roles": ["my-role"],
+            },
         )
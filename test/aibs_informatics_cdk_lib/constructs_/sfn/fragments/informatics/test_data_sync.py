@@ -0,0 +1,100 @@
+from typing import Any
+
+import aws_cdk as cdk
+from aws_cdk import aws_s3 as s3
+from aws_cdk.assertions import Match
+
+from aibs_informatics_cdk_lib.constructs_.sfn.fragments.informatics.data_sync import (
+    DistributedDataSyncFragment,
+)
+from test.aibs_informatics_cdk_lib.base import CdkBaseTest
+
+DISTRIBUTED_MAP_POLICY_NAME = Match.string_like_regexp("DistributedMapPolicy")
+
+
+class TestDistributedDataSyncFragment(CdkBaseTest):
+    def create_fragment(self, stack_name: str, **kwargs) -> DistributedDataSyncFragment:
+        stack = self.get_dummy_stack(stack_name)
+        fragment = DistributedDataSyncFragment(
+            stack,
+            "data-sync",
+            self.env_base,
+            aibs_informatics_docker_asset="aibs-informatics:latest",
+            batch_job_queue="job-queue",
+            scaffolding_bucket=s3.Bucket(stack, "bucket"),
+            **kwargs,
+        )
+        fragment.to_state_machine("data-sync")
+        return fragment
+
+    def get_map_state_json(self, fragment: DistributedDataSyncFragment) -> dict[str, Any]:
+        map_state = fragment.node.find_child("data-sync: Batch Data Sync: Map Start")
+        return cdk.Stack.of(fragment).resolve(map_state.to_state_json())
+
+    def get_batch_data_sync_resource_requirements(
+        self, fragment: DistributedDataSyncFragment
+    ) -> list[dict[str, str]]:
+        stack = cdk.Stack.of(fragment)
+        # The batch data sync function is created in the fragment's scope, not the fragment
+        register_state = stack.node.find_child("data-sync: Batch Data Sync")
+        for child_id in (
+            "data-sync: Batch Data Sync Batch",
+            "data-sync: Batch Data Sync Batch RegisterJobDefinition Prep",
+        ):
+            register_state = register_state.node.find_child(child_id)
+        register_state_json = stack.resolve(register_state.to_state_json())
+        return register_state_json["Parameters"]["ContainerProperties"]["ResourceRequirements"]
+
+    def test__init__uses_default_batch_data_sync_resources(self):
+        fragment = self.create_fragment("DataSyncDefaultResourcesStack")
+
+        assert self.get_batch_data_sync_resource_requirements(fragment) == [
+            {"Type": "MEMORY", "Value": "4096"},
+            {"Type": "VCPU", "Value": "2"},
+        ]
+
+    def test__init__with_batch_data_sync_resources(self):
+        fragment = self.create_fragment(
+            "DataSyncCustomResourcesStack", batch_data_sync_memory=8192, batch_data_sync_vcpus=4
+        )
+
+        assert self.get_batch_data_sync_resource_requirements(fragment) == [
+            {"Type": "MEMORY", "Value": "8192"},
+            {"Type": "VCPU", "Value": "4"},
+        ]
+
+    def test__init__uses_inline_map_by_default(self):
+        fragment = self.create_fragment("DataSyncInlineStack")
+
+        map_state_json = self.get_map_state_json(fragment)
+        assert "Iterator" in map_state_json
+        assert "ItemProcessor" not in map_state_json
+
+        template = self.get_template(cdk.Stack.of(fragment))
+        policies = template.find_resources(
+            "AWS::IAM::Policy", {"Properties": {"PolicyName": DISTRIBUTED_MAP_POLICY_NAME}}
+        )
+        assert policies == {}
+
+    def test__init__with_distributed_map(self):
+        fragment = self.create_fragment("DataSyncDistributedStack", use_distributed_map=True)
+
+        map_state_json = self.get_map_state_json(fragment)
+        assert "Iterator" not in map_state_json
+        assert map_state_json["ItemProcessor"]["ProcessorConfig"] == {
+            "Mode": "DISTRIBUTED",
+            "ExecutionType": "STANDARD",
+        }
+
+        template = self.get_template(cdk.Stack.of(fragment))
+        template.has_resource_properties(
+            "AWS::IAM::Policy",
+            {
+                "PolicyName": DISTRIBUTED_MAP_POLICY_NAME,
+                "PolicyDocument": {
+                    "Statement": Match.array_with(
+                        [Match.object_like({"Action": "states:StartExecution"})]
+                    ),
+                },
+            },
+        )
@@ -0,0 +1,125 @@
+from typing import cast
+
+from aibs_informatics_core.utils.tools.dicttools import convert_key_case
+from aibs_informatics_core.utils.tools.strtools import pascalcase
+from aws_cdk import aws_ec2 as ec2
+from aws_cdk import aws_efs as efs
+from aws_cdk import aws_stepfunctions as sfn
+
+from aibs_informatics_cdk_lib.constructs_.efs.file_system import MountPointConfiguration
+from aibs_informatics_cdk_lib.constructs_.sfn.fragments.batch import (
+    AWSBatchMixins,
+    SubmitJobFragment,
+    _to_pascal_keys,
+)
+from test.aibs_informatics_cdk_lib.base import CdkBaseTest
+
+
+class TestSubmitJobFragment(CdkBaseTest):
+    def test__from_defaults__merges_defaults_with_input(self):
+        stack = self.get_dummy_stack("SubmitJobDefaultsStack")
+
+        fragment = SubmitJobFragment.from_defaults(
+            stack,
+            "SubmitJob",
+            env_base=self.env_base,
+            name="test-job",
+            job_queue="test-queue",
+            image="test-image",
+            command="echo hello",
+            environment={"FOO": "bar"},
+        )
+
+        start_state = cast(sfn.State, fragment.start_state)
+        assert stack.resolve(start_state.to_state_json()) == {
+            "Type": "Pass",
+            "Parameters": {
+                "input.$": "$",
+                "default": {
+                    "command": "echo hello",
+                    "job_queue": "test-queue",
+                    "environment": {"FOO": "bar"},
+                    "image": "test-image",
+                    "memory": "1024",
+                    "vcpus": "1",
+                    "gpu": "0",
+                    "platform_capabilities": ["EC2"],
+                },
+            },
+            "Next": "Merge",
+        }
+
+        merge_state = cast(sfn.State, fragment.node.find_child("Merge"))
+        assert stack.resolve(merge_state.to_state_json()) == {
+            "Type": "Pass",
+            "Parameters": {
+                "request.$": "States.JsonMerge($.default, $.input, false)",
+            },
+            "Next": "SubmitJob Register Enclosure",
+        }
+
+    def test__from_defaults__accepts_reference_path_defaults(self):
+        stack = self.get_dummy_stack("SubmitJobRefsStack")
+
+        fragment = SubmitJobFragment.from_defaults(
+            stack,
+            "SubmitJob",
+            env_base=self.env_base,
+            name="test-job",
+            job_queue=sfn.JsonPath.string_at("$.queue"),
+            image="test-image",
+            command=cast(str, sfn.JsonPath.list_at("$.cmd")),
+            memory=sfn.JsonPath.number_at("$.mem"),
+        )
+
+        start_state = cast(sfn.State, fragment.start_state)
+        defaults = stack.resolve(start_state.to_state_json())["Parameters"]["default"]
+        assert defaults["job_queue.$"] == "$.queue"
+        assert defaults["command.$"] == "$.cmd"
+        assert defaults["memory.$"] == "$.mem"
+        assert not {"job_queue", "command", "memory"} & defaults.keys()
+
+
+class TestAWSBatchMixins(CdkBaseTest):
+    def test__convert_to_mount_point_and_volumes__matches_pascalcase_conversion(self):
+        stack = self.get_dummy_stack("MountPointStack")
+        file_system = efs.FileSystem.from_file_system_attributes(
+            stack,
+            "fs",
+            file_system_id="fs-12345678",
+            security_group=ec2.SecurityGroup.from_security_group_id(stack, "sg", "sg-12345678"),
+        )
+        access_point = efs.AccessPoint.from_access_point_attributes(
+            stack, "ap", access_point_id="fsap-12345678", file_system=file_system
+        )
+        mount_point_configs = [
+            MountPointConfiguration.from_file_system(file_system, read_only=True),
+            MountPointConfiguration.from_access_point(access_point, mount_point="/opt/ap"),
+        ]
+
+        mount_points, volumes = AWSBatchMixins.convert_to_mount_point_and_volumes(
+            mount_point_configs
+        )
+
+        for i, mpc in enumerate(mount_point_configs):
+            name = f"efs-vol{i}"
+            assert mount_points[i] == convert_key_case(mpc.to_batch_mount_point(name), pascalcase)
+            assert volumes[i] == convert_key_case(mpc.to_batch_volume(name), pascalcase)
+
+    def test__to_pascal_keys__converts_mappings_nested_in_lists(self):
+        data = {
+            "sourceVolume": "vol",
+            "efsVolumeConfiguration": {"authorizationConfig": {"iam": "ENABLED"}},
+            "volumes": [{"name": "vol", "host": {"sourcePath": "/tmp"}}, "literal"],
+            "unknownKey": ({"containerPath": "/opt"},),
+        }
+
+        assert _to_pascal_keys(data) == {
+            "SourceVolume": "vol",
+            "EfsVolumeConfiguration": {"AuthorizationConfig": {"Iam": "ENABLED"}},
+            "Volumes": [{"Name": "vol", "Host": {"SourcePath": "/tmp"}}, "literal"],
+            "UnknownKey": ({"ContainerPath": "/opt"},),
+        }
+        # Lists are converted the same way as convert_key_case
+        list_data = {k: v for k, v in data.items() if k != "unknownKey"}
+        assert _to_pascal_keys(list_data) == convert_key_case(list_data, pascalcase)
@@ -5,6 +5,16 @@ from aws_cdk import aws_stepfunctions as sfn
 from aibs_informatics_cdk_lib.constructs_.sfn.states.s3 import S3Operation
 from test.aibs_informatics_cdk_lib.base import CdkBaseTest
 
+DEFAULT_S3_RETRY = [
+    {
+        "ErrorEquals": ["S3.S3Exception"],
+        "IntervalSeconds": 3,
+        "MaxAttempts": 5,
+        "BackoffRate": 2.0,
+        "JitterStrategy": "FULL",
+    },
+]
+
 
 class TestS3Operation(CdkBaseTest):
     def test_put_object_with_literals(self):
@@ -45,15 +55,7 @@ class TestS3Operation(CdkBaseTest):
             },
             "ResultPath": sfn.JsonPath.DISCARD,
             "Next": "PutLiteral PutObject Post",
-            "Retry": [
-                {
-                    "ErrorEquals": ["S3.S3Exception"],
-                    "IntervalSeconds": 3,
-                    "MaxAttempts": 5,
-                    "BackoffRate": 2.0,
-                    "JitterStrategy": "FULL",
-                },
-            ],
+            "Retry": DEFAULT_S3_RETRY,
         }
 
         end_state = cast(sfn.State, chain.end_states[0])
@@ -128,15 +130,7 @@ class TestS3Operation(CdkBaseTest):
             },
             "ResultPath": "$",
             "OutputPath": "$",
-            "Retry": [
-                {
-                    "ErrorEquals": ["S3.S3Exception"],
-                    "IntervalSeconds": 3,
-                    "MaxAttempts": 5,
-                    "BackoffRate": 2.0,
-                    "JitterStrategy": "FULL",
-                },
-            ],
+            "Retry": DEFAULT_S3_RETRY,
         }
 
     def test_put_payload_generates_key_when_missing(self):
@@ -221,15 +215,7 @@ class TestS3Operation(CdkBaseTest):
             },
             "ResultPath": "$",
             "OutputPath": "$",
-            "Retry": [
-                {
-                    "ErrorEquals": ["S3.S3Exception"],
-                    "IntervalSeconds": 3,
-                    "MaxAttempts": 5,
-                    "BackoffRate": 2.0,
-                    "JitterStrategy": "FULL",
-                },
-            ],
+            "Retry": DEFAULT_S3_RETRY,
             "Next": "GetPayload Post",
         }
 
@@ -18,11 +18,16 @@ class TestExternaSnsTriggerStack(CdkBaseTest):
         )
 
         template = self.get_template(stack)
-        template.resource_count_is("AWS::Lambda::EventSourceMapping", 0)
-        template.resource_count_is("AWS::SNS::Subscription", 1)
-        template.resource_count_is("AWS::SQS::Queue", 2)
-        template.resource_count_is("AWS::SQS::QueuePolicy", 1)
-        template.resource_count_is("AWS::CloudWatch::Alarm", 1)
+        self.assert_resource_counts(
+            template,
+            {
+                "AWS::Lambda::EventSourceMapping": 0,
+                "AWS::SNS::Subscription": 1,
+                "AWS::SQS::Queue": 2,
+                "AWS::SQS::QueuePolicy": 1,
+                "AWS::CloudWatch::Alarm": 1,
+            },
+        )
 
     def test__init__with_triggered_lambda_fn(self):
         stack = self.get_dummy_stack("dummy-test-stack")
@@ -50,11 +55,16 @@ class TestExternaSnsTriggerStack(CdkBaseTest):
         assert trigger_construct.dlq_name == self.env_base.prefixed("test-event", "sns-event-dlq")
 
         template = self.get_template(stack)
-        template.resource_count_is("AWS::Lambda::EventSourceMapping", 1)
-        template.resource_count_is("AWS::SNS::Subscription", 1)
-        template.resource_count_is("AWS::SQS::Queue", 2)
-        template.resource_count_is("AWS::SQS::QueuePolicy", 1)
-        template.resource_count_is("AWS::CloudWatch::Alarm", 1)
+        self.assert_resource_counts(
+            template,
+            {
+                "AWS::Lambda::EventSourceMapping": 1,
+                "AWS::SNS::Subscription": 1,
+                "AWS::SQS::Queue": 2,
+                "AWS::SQS::QueuePolicy": 1,
+                "AWS::CloudWatch::Alarm": 1,
+            },
+        )
 
     def test__init__with_queue_and_dlq_name_properties(self):
         stack = self.get_dummy_stack("dummy-test-stack")
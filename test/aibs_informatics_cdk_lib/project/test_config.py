@@ -134,11 +134,7 @@ class ProjectConfigTests(BaseTest):
             default_config_overrides=default_config_overrides,
         )
 
-        expected_config = StageConfig.model_validate(
-            {
-                **default_config.model_copy().model_dump(exclude_unset=True),
-            }
-        )
+        expected_config = default_config.model_copy(deep=True)
         expected_config.env.env_type = EnvType.DEV
         expected_config.env.label = "marmot"
         expected_config.env.account = "111222333"
@@ -147,6 +143,21 @@ class ProjectConfigTests(BaseTest):
 
         self.assertEqual(resolved_config, expected_config)
 
+    def test__get_stage_config__no_overrides_returns_copy_of_default(self):
+        default_config = create_stage_config()
+        proj_config = ProjectConfig(
+            global_config=create_global_config(),
+            default_config=default_config,
+            default_config_overrides={EnvType.DEV: {}},
+        )
+
+        resolved_config = proj_config.get_stage_config("dev", "overridelabel")
+
+        self.assertEqual(resolved_config.env.label, "overridelabel")
+        self.assertEqual(default_config.env.label, "gcs")
+        resolved_config.env.label = default_config.env.label
+        self.assertEqual(resolved_config, default_config)
+
     def test__parse_file__test_loads_json_and_yml(self):
         # Load original file
         proj_config = ProjectConfig(
@@ -177,11 +188,7 @@ class ProjectConfigTests(BaseTest):
             default_config=default_config,
             default_config_overrides=default_config_overrides,
         )
-        expected_config = StageConfig.model_validate(
-            {
-                **default_config.model_copy().model_dump(exclude_unset=True),
-            }
-        )
+        expected_config = default_config.model_copy(deep=True)
         expected_config.env.env_type = EnvType.DEV
         expected_config.env.label = "overridelabel"
         expected_config.env.account = "111222333"
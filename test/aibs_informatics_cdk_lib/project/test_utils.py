@@ -27,10 +27,15 @@ from aibs_informatics_cdk_lib.project.utils import (
 USER = "marmotdev"
 
 
+@pytest.fixture(scope="session")
+def app():
+    return cdk.App(analytics_reporting=False, auto_synth=False)
+
+
 @pytest.fixture(scope="function")
-def dummy_node():
-    app = cdk.App(analytics_reporting=False, auto_synth=False)
-    construct = constructs.Construct(app, "construct")
+def dummy_node(app, request):
+    # Context is set on the per-test construct, so tests stay isolated under the shared app
+    construct = constructs.Construct(app, request.node.name)
     node = construct.node
     return node
 
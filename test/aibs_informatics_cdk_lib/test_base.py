@@ -0,0 +1,32 @@
+import aws_cdk as cdk
+from aws_cdk import aws_sqs as sqs
+
+from test.aibs_informatics_cdk_lib.base import CdkBaseTest
+
+
+class CdkBaseTestTests(CdkBaseTest):
+    def test__get_template__reuses_template_for_same_stack(self):
+        stack = self.get_dummy_stack("test")
+        sqs.Queue(stack, "queue")
+
+        template = self.get_template(stack)
+        self.assertIs(self.get_template(stack), template)
+        template.resource_count_is("AWS::SQS::Queue", 1)
+
+    def test__get_template__stack_cannot_change_after_synth(self):
+        stack = self.get_dummy_stack("test")
+        sqs.Queue(stack, "queue")
+        self.get_template(stack)
+
+        sqs.Queue(stack, "another-queue")
+        with self.assertRaises(RuntimeError):
+            self.app.synth()
+
+    def test__get_template__separates_stacks_with_same_path(self):
+        stack = self.get_dummy_stack("test")
+        sqs.Queue(stack, "queue")
+        self.get_template(stack).resource_count_is("AWS::SQS::Queue", 1)
+
+        self.app = cdk.App()
+        other_stack = self.get_dummy_stack("test")
+        self.get_template(other_stack).resource_count_is("AWS::SQS::Queue", 0)